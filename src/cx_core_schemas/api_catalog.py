@@ -1,5 +1,19 @@
-from pydantic import BaseModel, Field
-from typing import Any, Dict, Literal, Optional, List
+import sys
+
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, SkipValidation
+from typing import Annotated, Any, Dict, Literal, Optional, List, Self
+
+
+def _intern_str(value: Any) -> Any:
+    """Interns short strings so values repeated across a catalog share one object."""
+    if type(value) is str and len(value) < 64:
+        return sys.intern(value)
+    return value
+
+
+# A string that is interned on validation, for small values (auth field names,
+# method types, categories) that recur across thousands of catalog entries.
+InternedStr = Annotated[str, BeforeValidator(_intern_str)]
 
 
 class AuthField(BaseModel):
@@ -8,7 +22,7 @@ class AuthField(BaseModel):
     metadata needed for a CLI to dynamically and securely prompt for it.
     """
 
-    name: str = Field(
+    name: InternedStr = Field(
         ...,
         description="The key for this field (e.g., 'server', 'api_key', 'username').",
     )
@@ -25,6 +39,8 @@ class AuthField(BaseModel):
         description="If true, the interactive CLI prompt will mask the user's input.",
     )
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
 class SupportedAuthMethod(BaseModel):
     """
@@ -33,7 +49,7 @@ class SupportedAuthMethod(BaseModel):
     supports. This is the contract that drives the `cx connection create` command.
     """
 
-    type: str = Field(
+    type: InternedStr = Field(
         ...,
         description="A unique identifier for this method within the blueprint (e.g., 'credentials', 'api_key').",
     )
@@ -46,6 +62,24 @@ class SupportedAuthMethod(BaseModel):
         description="A list of all the fields that must be collected from the user for this method.",
     )
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> Self:
+        """
+        Builds an auth method from pre-validated data without running validation.
+        Nested fields given as plain dicts are constructed the same way.
+        """
+        if "fields" in data:
+            data = {
+                **data,
+                "fields": [
+                    AuthField.model_construct(**f) if isinstance(f, dict) else f
+                    for f in data["fields"]
+                ],
+            }
+        return cls.model_construct(**data)
+
 
 class ApiCatalogBase(BaseModel):
     """Base fields for an entry in the API service catalog."""
@@ -53,7 +87,7 @@ class ApiCatalogBase(BaseModel):
     name: str
     id: str
     description: Optional[str] = None
-    category: str = "General"
+    category: InternedStr = "General"
     icon: Optional[str] = None
     docs_url: Optional[str] = None
     supported_auth_methods: List[SupportedAuthMethod] = Field(default_factory=list)
@@ -64,31 +98,56 @@ class ApiCatalogBase(BaseModel):
         description="The registration key for the connection strategy (e.g., 'rest-api_key').",
     )
     # This field holds the declarative blueprint for browsing and interaction.
-    # We define it as a flexible dictionary.
-    browse_config: Optional[Dict[str, Any]] = Field(
+    # We define it as a flexible dictionary that is passed through unvalidated,
+    # since consumers interpret these blueprints themselves. This applies to all
+    # the *_config and source_spec fields below. The caller's object is stored as-is
+    # (not copied), so mutating one mutates the other, and a non-dict value is
+    # accepted but triggers PydanticSerializationUnexpectedValue warnings on dump.
+    browse_config: SkipValidation[Optional[Dict[str, Any]]] = Field(
         default=None,
         description="A declarative blueprint for browsing this service via the VFS.",
     )
     # The blueprint for how to authenticate.
-    auth_config: Optional[Dict[str, Any]] = Field(
+    auth_config: SkipValidation[Optional[Dict[str, Any]]] = Field(
         default=None, description="A declarative blueprint for handling authentication."
     )
-    oauth_config: Optional[Dict[str, Any]] = Field(
+    oauth_config: SkipValidation[Optional[Dict[str, Any]]] = Field(
         default=None, description="A declarative blueprint for handling OAuth 2.0."
     )
     # The blueprint for how to test the connection.
-    test_connection_config: Optional[Dict[str, Any]] = Field(
+    test_connection_config: SkipValidation[Optional[Dict[str, Any]]] = Field(
         default=None,
         description="Configuration for the 'Test Connection' functionality.",
     )
     # --- Internal fields, populated at runtime by the resolver ---
-    source_spec: Optional[Dict[str, Any]] = Field(default=None, exclude=True)
+    source_spec: SkipValidation[Optional[Dict[str, Any]]] = Field(
+        default=None, exclude=True
+    )
     schemas_module_path: Optional[str] = Field(
         default=None,
         description="The absolute path to the generated schemas.py file for this blueprint.",
         exclude=True,
     )
 
+    model_config = ConfigDict(defer_build=True)
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> Self:
+        """
+        Builds a catalog entry from trusted, already-valid data (e.g., vendored
+        blueprint YAML) via `model_construct`, skipping validation entirely.
+        Nested auth methods given as plain dicts are constructed the same way.
+        """
+        if "supported_auth_methods" in data:
+            data = {
+                **data,
+                "supported_auth_methods": [
+                    SupportedAuthMethod.from_trusted(m) if isinstance(m, dict) else m
+                    for m in data["supported_auth_methods"]
+                ],
+            }
+        return cls.model_construct(**data)
+
 
 class ApiCatalog(ApiCatalogBase):
     """The full API Catalog model, including the database ID."""
@@ -1,7 +1,13 @@
 # /home/dpwanjala/repositories/cx-core-schemas/src/cx_core_schemas/connector_script.py
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation, model_validator
+
+
+# Shared by every action and the models nested in a `run` payload (FileToWrite):
+# unknown keys are rejected rather than silently dropped, values are not coerced,
+# and parsed actions are immutable.
+_ACTION_CONFIG = ConfigDict(extra="forbid", strict=True, frozen=True, defer_build=True)
 
 
 # --- Base Action Model ---
@@ -10,6 +16,8 @@ from pydantic import BaseModel, Field, model_validator
 class BaseAction(BaseModel):
     action: str
 
+    model_config = _ACTION_CONFIG
+
 
 # --- Standard Stateless Action Models ---
 
@@ -116,6 +124,8 @@ class FileToWrite(BaseModel):
         ..., description="The content of the file, can be a Jinja template."
     )
 
+    model_config = _ACTION_CONFIG
+
 
 class WriteFilesAction(BaseAction):
     action: Literal["write_files"]
@@ -182,26 +192,30 @@ class BrowserGetLocalStorageAction(BaseAction):
 
 # --- Discriminated Union of ALL Possible Actions ---
 # Pydantic uses this to determine which model to validate based on the 'action' field.
-AnyConnectorAction = Union[
-    # Standard Stateless Actions
-    TestConnectionAction,
-    BrowsePathAction,
-    ReadContentAction,
-    RunSqlQueryAction,
-    RunDeclarativeAction,
-    AggregateContentAction,
-    RunPythonScriptAction,
-    WriteFilesAction,
-    RunTransformAction,
-    # Stateful Browser Actions
-    BrowserNavigateAction,
-    BrowserClickAction,
-    BrowserTypeAction,
-    BrowserGetHtmlAction,
-    BrowserGetLocalStorageAction,
-    # multi steps flows and actions
-    RunMultiQueryAction,
-    RunFlowAction,
+# The discriminator lives on the alias so every usage gets a tagged-union validator.
+AnyConnectorAction = Annotated[
+    Union[
+        # Standard Stateless Actions
+        TestConnectionAction,
+        BrowsePathAction,
+        ReadContentAction,
+        RunSqlQueryAction,
+        RunDeclarativeAction,
+        AggregateContentAction,
+        RunPythonScriptAction,
+        WriteFilesAction,
+        RunTransformAction,
+        # Stateful Browser Actions
+        BrowserNavigateAction,
+        BrowserClickAction,
+        BrowserTypeAction,
+        BrowserGetHtmlAction,
+        BrowserGetLocalStorageAction,
+        # multi steps flows and actions
+        RunMultiQueryAction,
+        RunFlowAction,
+    ],
+    Field(discriminator="action"),
 ]
 
 
@@ -219,7 +233,7 @@ class ConnectorStep(BaseModel):
     # 'name' is now optional, as Markdown blocks won't have it.
     name: Optional[str] = None
 
-    description: str | None = None
+    description: Optional[str] = None
 
     engine: Optional[
         Literal[
@@ -242,7 +256,6 @@ class ConnectorStep(BaseModel):
     )
     run: Optional[AnyConnectorAction] = Field(
         None,
-        discriminator="action",
         description="The declarative action payload for this step.",
     )
     # NEW: The 'content' field for notebook blocks.
@@ -280,10 +293,11 @@ class ConnectorStep(BaseModel):
         alias="if",
         description="A Jinja2 expression that must evaluate to true for the step to run.",
     )
-    cache_config: Optional[Dict[str, Any]] = None
+    # Passed through unvalidated: the caller's dict is stored as-is (not copied),
+    # and a non-dict value is accepted but warns when the model is dumped.
+    cache_config: SkipValidation[Optional[Dict[str, Any]]] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class ScriptInputParameter(BaseModel):
@@ -294,12 +308,14 @@ class ScriptInputParameter(BaseModel):
     required: bool = False
     default: Optional[Any] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ConnectorScript(BaseModel):
     """The root model for a declarative .flow.yaml file."""
 
     name: str
-    description: str | None = None
+    description: Optional[str] = None
     # THIS IS THE NEW, CRITICAL FIELD FOR STATEFUL PROVIDERS
     session_provider: Optional[str] = Field(
         None, description="The key for a stateful session provider, e.g., 'browser'."
@@ -308,7 +324,8 @@ class ConnectorScript(BaseModel):
         None, description="A schema defining the expected parameters for this script."
     )
     steps: List[ConnectorStep]
-    cache_config: Optional[Dict[str, Any]] = None
+    # Passed through unvalidated, like ConnectorStep.cache_config.
+    cache_config: SkipValidation[Optional[Dict[str, Any]]] = None
     script_input: Optional[Dict[str, Any]] = Field(
         default_factory=dict, description="Placeholder for data piped from stdin."
     )
@@ -317,3 +334,13 @@ class ConnectorScript(BaseModel):
         description="Placeholder for data piped from stdin.",
         exclude=True,
     )
+
+    model_config = ConfigDict(defer_build=True)
+
+
+def parse_script_json(data: Union[str, bytes]) -> ConnectorScript:
+    """
+    Parses a JSON-encoded script straight into a ConnectorScript, letting
+    pydantic-core decode the bytes without an intermediate Python dict.
+    """
+    return ConnectorScript.model_validate_json(data)
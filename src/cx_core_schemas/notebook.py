@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Dict, List, Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Dict, List, Optional, Union
 from .connector_script import ScriptInputParameter, ConnectorStep
 
 
@@ -102,3 +102,13 @@ class ContextualPage(BaseModel):
         default_factory=list,
         description="A list of tags for categorization and discovery.",
     )
+
+    model_config = ConfigDict(defer_build=True)
+
+
+def parse_page_json(data: Union[str, bytes]) -> ContextualPage:
+    """
+    Parses a JSON-encoded page straight into a ContextualPage, letting
+    pydantic-core decode the bytes without an intermediate Python dict.
+    """
+    return ContextualPage.model_validate_json(data)